@@ -0,0 +1,185 @@
+"""Render benchmark: the handlers' catalog rendering vs the old inline f-strings.
+
+The catalog side calls the real helpers from handler.py, so the equality
+checks cover exactly what the bot sends. Run from the bot/ directory:
+
+    python bench_render.py
+"""
+import timeit
+
+import handler
+from i18n import get_catalog
+from menu_order.option_item import SIZE_OPTIONS, SUGAR_OPTIONS, ICE_OPTIONS
+
+
+ORDER = {
+    "category": "coffee",
+    "item_name": "Latte",
+    "emoji": "☕",
+    "base_price": 4.0,
+    "size": "large",
+    "sugar": "25",
+    "ice": "less",
+    "quantity": 2,
+}
+FOOD = {**ORDER, "category": "food", "item_name": "Bagel", "emoji": "🥯"}
+ORDER_ARGS = ("ORD20260101100000", "pickup", "A B", "2026-01-01 10:00:00")
+
+BENCH_UID = 0  # synthetic user for the paginated cart
+CART_LINES = 50
+
+
+# --- old inline renderers (as they were before the catalog) ---
+def inline_order_view(t):
+    size_add = SIZE_OPTIONS.get(t["size"], {}).get("price", 0.0)
+    total = (t["base_price"] + size_add) * t["quantity"]
+    text = f"{t['emoji']} {t['item_name']}\n"
+    text += f"📏 ទំហំ: {SIZE_OPTIONS.get(t['size'], {}).get('label', t['size'])}\n"
+    if t["category"] != "food":
+        text += (
+            f"🍬 ស្ករ: {SUGAR_OPTIONS.get(t['sugar'], {}).get('label', t['sugar'])}\n"
+        )
+        text += f"🧊 ទឹកកក: {ICE_OPTIONS.get(t['ice'], {}).get('label', t['ice'])}\n"
+    text += f"🔢 ចំនួន: {t['quantity']}\n\n💰 តម្លៃសរុប: ${total:.2f}"
+    return text
+
+
+def inline_added(t, total):
+    text = (
+        f"✅ បានបញ្ចូលទៅកន្ត្រក!\n\n"
+        f"{t['emoji']} {t['item_name']}\n"
+        f"📏 ទំហំ: {SIZE_OPTIONS.get(t['size'], {}).get('label', t['size'])}\n"
+    )
+    if t["category"] != "food":
+        text += (
+            f"🍬 ស្ករ: {SUGAR_OPTIONS.get(t['sugar'], {}).get('label', t['sugar'])}\n"
+            f"🧊 ទឹកកក: {ICE_OPTIONS.get(t['ice'], {}).get('label', t['ice'])}\n"
+        )
+    text += f"🔢 ចំនួន: {t['quantity']}\n" f"💰 តម្លៃ: ${total:.2f}"
+    return text
+
+
+def inline_cart(cart):
+    text = "🛒 កន្ត្រករបស់អ្នក:\n\n"
+    total_all = 0.0
+    for i, it in enumerate(cart, 1):
+        text += f"{i}. {it.get('emoji','')} {it.get('item_name','')} x{it.get('quantity',1)} = ${it.get('total_price',0):.2f}\n"
+        total_all += it.get("total_price", 0.0)
+    text += f"\n💰 សរុប: ${total_all:.2f}"
+    return text
+
+
+def inline_receipt(cart, order_id, method, name, now):
+    total_all = sum(it.get("total_price", 0) for it in cart)
+    delivery_text = "មកយកផ្ទាល់" if method == "pickup" else "ដឹកជញ្ជូន"
+    text = f"🧾 ព័ត៌មានការកម្មង់ #{order_id}\n"
+    text += f"📦 វិធី: {delivery_text}\n"
+    text += f"👤 អ្នកកម្មង់: {name}\n"
+    text += f"🕒 ពេលវេលា: {now}\n\n"
+    for i, item in enumerate(cart, 1):
+        text += (
+            f"{i}. {item.get('emoji','')} {item.get('item_name','')}\n"
+            f"   📏 ទំហំ: {SIZE_OPTIONS.get(item['size'], {}).get('label', item['size'])}\n"
+            f"   🍬 ស្ករ: {SUGAR_OPTIONS.get(item['sugar'], {}).get('label', item['sugar'])}\n"
+            f"   🧊 ទឹកកក: {ICE_OPTIONS.get(item['ice'], {}).get('label', item['ice'])}\n"
+            f"   🔢 ចំនួន: {item['quantity']}\n"
+            f"   💰 តម្លៃសរុប: ${item['total_price']:.2f}\n\n"
+        )
+    text += f"💰 សរុប: ${total_all:.2f}\n"
+    text += "🙏 សូមអរគុណសម្រាប់ការកម្មង់របស់អ្នក!"
+    return text
+
+
+def inline_notify(cart, order_id, method, name, now):
+    total_all = sum(it.get("total_price", 0) for it in cart)
+    delivery_text = "មកយកផ្ទាល់" if method == "pickup" else "ដឹកជញ្ជូន"
+    text = (
+        f"🔔 កម្មង់ថ្មី #{order_id}\n"
+        f"👤 អ្នកកម្មង់: {name}\n"
+        f"📦 វិធី: {delivery_text}\n"
+        f"🕒 {now}\n\n"
+    )
+    for i, item in enumerate(cart, 1):
+        text += (
+            f"{i}. {item.get('emoji','')} {item.get('item_name','')}\n"
+            f"   📏 ទំហំ: {SIZE_OPTIONS.get(item['size'], {}).get('label', item['size'])}\n"
+        )
+        if item.get("category") != "food":
+            text += (
+                f"   🍬 ស្ករ: {SUGAR_OPTIONS.get(item['sugar'], {}).get('label', item['sugar'])}\n"
+                f"   🧊 ទឹកកក: {ICE_OPTIONS.get(item['ice'], {}).get('label', item['ice'])}\n"
+            )
+        text += f"   🔢 ចំនួន: {item['quantity']}\n" f"   💰 ${item['total_price']:.2f}\n\n"
+    text += f"💰សរុប: ${total_all:.2f}\n"
+    return text
+
+
+# --- helpers ---
+def fill_cart(lines):
+    handler._cart_clear(BENCH_UID)
+    for i in range(lines):
+        t = FOOD if i % 3 == 2 else ORDER
+        handler._cart_add(BENCH_UID, handler._cart_item(t, next(handler._line_ids)))
+    return handler.get_cart(BENCH_UID)
+
+
+def uncached_page(tr, keep_lines=False):
+    handler.cart_pages.pop(BENCH_UID, None)
+    if not keep_lines:
+        for item in handler.get_cart(BENCH_UID):
+            item.pop("rendered", None)
+    return handler._cart_page(tr, BENCH_UID, 0)
+
+
+def check_khmer_output(km):
+    """The Khmer catalog must render exactly what the inline code did."""
+    for t in (ORDER, FOOD):
+        assert handler._order_view_text(km, t) == inline_order_view(t)
+        total = handler._unit_price(t) * t["quantity"]
+        assert handler._added_text(km, t, total) == inline_added(t, total)
+
+    # one page, so the paginated view equals the old full cart
+    cart = fill_cart(handler.CART_PAGE_SIZE)
+    assert handler._cart_page(km, BENCH_UID, 0)[0] == inline_cart(cart)
+
+    total = handler.get_cart_total(BENCH_UID)
+    assert handler._order_receipt_text(
+        km, cart, *ORDER_ARGS, total
+    ) == inline_receipt(cart, *ORDER_ARGS)
+    assert handler._order_notify_text(
+        km, cart, *ORDER_ARGS, total
+    ) == inline_notify(cart, *ORDER_ARGS)
+
+
+def bench(label, func, number):
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{label:<36} {best / number * 1e6:8.2f} us")
+
+
+def main():
+    km = get_catalog("km")
+    en = get_catalog("en")
+    check_khmer_output(km)
+
+    bench("order view: inline", lambda: inline_order_view(ORDER), 20000)
+    bench("order view: catalog km", lambda: handler._order_view_text(km, ORDER), 20000)
+    bench("order view: catalog en", lambda: handler._order_view_text(en, ORDER), 20000)
+
+    cart = fill_cart(CART_LINES)
+    bench(f"cart x{CART_LINES}: inline, full cart", lambda: inline_cart(cart), 2000)
+    bench(f"cart x{CART_LINES}: page, cold caches", lambda: uncached_page(km), 2000)
+    bench(
+        f"cart x{CART_LINES}: page, warm line cache",
+        lambda: uncached_page(km, keep_lines=True),
+        2000,
+    )
+    bench(
+        f"cart x{CART_LINES}: page, cached page",
+        lambda: handler._cart_page(km, BENCH_UID, 0),
+        2000,
+    )
+    handler._cart_clear(BENCH_UID)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 import os
+import io
+import asyncio
 import logging
+import itertools
 from datetime import datetime
+from math import ceil
+from functools import lru_cache
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -8,6 +13,14 @@ from telegram.ext import ContextTypes
 # Import menu and options (your existing files)
 from menu_order.menu_items import MENU
 from menu_order.option_item import SIZE_OPTIONS, SUGAR_OPTIONS, ICE_OPTIONS
+from i18n import get_catalog, DEFAULT_LOCALE
+from profiling import (
+    traced,
+    profiler_owner,
+    start_profiler,
+    stop_profiler,
+    format_route_stats,
+)
 
 
 load_dotenv()
@@ -25,8 +38,23 @@ GROUP_CHAT_ID = (
 
 # In-memory storage
 user_carts = {}  # user_id -> list
+cart_totals = {}  # user_id -> running total of user_carts[user_id]
+cart_pages = {}  # user_id -> {(catalog, page): (text, keyboard)}, reset on change
 temp_orders = {}  # user_id -> dict
 
+CART_PAGE_SIZE = 8
+ITEM_KEYS = (
+    "category",
+    "item_name",
+    "emoji",
+    "base_price",
+    "size",
+    "sugar",
+    "ice",
+    "quantity",
+)
+_line_ids = itertools.count(1)
+
 
 # --- Helpers ---
 def get_cart(uid: int):
@@ -35,12 +63,69 @@ def get_cart(uid: int):
     return user_carts[uid]
 
 
+def get_cart_total(uid: int) -> float:
+    return cart_totals.get(uid, 0.0)
+
+
+def _unit_price(t: dict) -> float:
+    return t["base_price"] + SIZE_OPTIONS.get(t["size"], {}).get("price", 0.0)
+
+
+def _cart_item(t: dict, line_id: int) -> dict:
+    """Cart line built from a temp order; line_id stays stable across edits."""
+    item = {k: t[k] for k in ITEM_KEYS}
+    item["line_id"] = line_id
+    item["total_price"] = _unit_price(t) * t["quantity"]
+    return item
+
+
+def _find_line(cart: list, line_id: int):
+    for pos, item in enumerate(cart):
+        if item["line_id"] == line_id:
+            return pos, item
+    return None, None
+
+
+def _cart_add(uid: int, item: dict):
+    cart_pages.pop(uid, None)
+    get_cart(uid).append(item)
+    cart_totals[uid] = round(get_cart_total(uid) + item["total_price"], 2)
+
+
+def _cart_replace(uid: int, pos: int, item: dict):
+    cart_pages.pop(uid, None)
+    cart = get_cart(uid)
+    old = cart[pos]
+    cart[pos] = item
+    cart_totals[uid] = round(
+        get_cart_total(uid) - old["total_price"] + item["total_price"], 2
+    )
+
+
+def _cart_remove(uid: int, pos: int):
+    cart_pages.pop(uid, None)
+    item = get_cart(uid).pop(pos)
+    cart_totals[uid] = round(get_cart_total(uid) - item["total_price"], 2)
+
+
+def _cart_clear(uid: int):
+    cart_pages.pop(uid, None)
+    user_carts[uid] = []
+    cart_totals[uid] = 0.0
+
+
 def get_temp(uid: int):
     if uid not in temp_orders:
         temp_orders[uid] = {}
     return temp_orders[uid]
 
 
+def _leave_edit_mode(uid: int):
+    """Drop a half-edited cart line so a later confirm_add can't overwrite it."""
+    if "editing" in temp_orders.get(uid, {}):
+        temp_orders[uid] = {}
+
+
 def _ensure_defaults(t: dict):
     """Ensure temp-order dictionary has required keys with defaults."""
     t.setdefault("category", "")
@@ -53,7 +138,334 @@ def _ensure_defaults(t: dict):
     t.setdefault("quantity", 1)
 
 
+def _tr(update):
+    """Message catalog for the user's Telegram language."""
+    user = getattr(update, "effective_user", None)
+    return get_catalog(user.language_code if user else None)
+
+
+def _item_lines(tr, item: dict, indent: str = "", all_options: bool = False):
+    """Size/sugar/ice/quantity lines of an order item.
+
+    Food has no sugar/ice lines unless ``all_options`` is set (the order
+    receipt has always listed them for every line).
+    """
+    lines = [indent + tr.size_line(size=tr.sizes.get(item["size"], item["size"]))]
+    if all_options or item.get("category") != "food":
+        lines.append(
+            indent + tr.sugar_line(sugar=tr.sugars.get(item["sugar"], item["sugar"]))
+        )
+        lines.append(indent + tr.ice_line(ice=tr.ices.get(item["ice"], item["ice"])))
+    lines.append(indent + tr.quantity_line(quantity=item["quantity"]))
+    return lines
+
+
+def _order_items_text(tr, cart: list, total_line, all_options: bool = False) -> str:
+    parts = []
+    for i, item in enumerate(cart, 1):
+        parts.append(
+            tr.order_line(
+                index=i, emoji=item.get("emoji", ""), item_name=item.get("item_name", "")
+            )
+        )
+        parts.extend(_item_lines(tr, item, "   ", all_options))
+        parts.append("   " + total_line(total=item["total_price"]))
+        parts.append("")
+    return "\n".join(parts)
+
+
+def _order_view_text(tr, t: dict) -> str:
+    """Summary of the temp order with its total price."""
+    return "\n".join(
+        [
+            tr.item_title(emoji=t["emoji"], item_name=t["item_name"]),
+            *_item_lines(tr, t),
+            "",
+            tr.item_total_line(total=_unit_price(t) * t["quantity"]),
+        ]
+    )
+
+
+def _added_text(tr, t: dict, total: float) -> str:
+    """Confirmation shown after a temp order was added to the cart."""
+    return "\n".join(
+        [
+            tr.added,
+            "",
+            tr.item_title(emoji=t["emoji"], item_name=t["item_name"]),
+            *_item_lines(tr, t),
+            tr.price_line(total=total),
+        ]
+    )
+
+
+def _order_receipt_text(tr, cart, order_id, method, customer, now, total) -> str:
+    """Order confirmation sent back to the customer."""
+    return "\n".join(
+        [
+            tr.order_title(order_id=order_id),
+            tr.method_line(
+                method=tr.method_pickup if method == "pickup" else tr.method_delivery
+            ),
+            tr.customer_line(name=customer),
+            tr.time_line(time=now),
+            "",
+            _order_items_text(tr, cart, tr.item_total_line, all_options=True),
+            tr.cart_total(total=total),
+            tr.thanks,
+        ]
+    )
+
+
+def _order_notify_text(tr, cart, order_id, method, customer, now, total) -> str:
+    """New-order notification for the shop's group chat."""
+    return "\n".join(
+        [
+            tr.new_order_title(order_id=order_id),
+            tr.customer_line(name=customer),
+            tr.method_line(
+                method=tr.method_pickup if method == "pickup" else tr.method_delivery
+            ),
+            tr.notify_time_line(time=now),
+            "",
+            _order_items_text(tr, cart, tr.notify_item_total),
+            tr.notify_total(total=total),
+            "",
+        ]
+    )
+
+
+def _cart_line(tr, item: dict, index: int):
+    """Rendered cart line and its edit button.
+
+    Cached on the item: _cart_item builds a new dict whenever a line changes,
+    and the index only moves when a line above it is removed.
+    """
+    cached = item.get("rendered")
+    if cached is not None and cached[0] is tr and cached[1] == index:
+        return cached[2], cached[3]
+    text = f"{index}. " + tr.cart_line(
+        emoji=item["emoji"],
+        item_name=item["item_name"],
+        quantity=item["quantity"],
+        total=item["total_price"],
+    )
+    button = InlineKeyboardButton(
+        tr.btn_edit_line(
+            index=index, item_name=item["item_name"], quantity=item["quantity"]
+        ),
+        callback_data=f"cart_item_{item['line_id']}",
+    )
+    item["rendered"] = (tr, index, text, button)
+    return text, button
+
+
+def _cart_page(tr, uid: int, page: int):
+    """Text and keyboard for one page of the cart; only that page is rendered.
+
+    Finished pages are kept in cart_pages until the cart changes.
+    """
+    cart = get_cart(uid)
+    pages = max(1, ceil(len(cart) / CART_PAGE_SIZE))
+    page = min(max(page, 0), pages - 1)
+    cached = cart_pages.setdefault(uid, {}).get((tr, page))
+    if cached is not None:
+        return cached
+    first = page * CART_PAGE_SIZE
+
+    lines = [tr.cart_title, ""]
+    kb = []
+    for i, item in enumerate(cart[first : first + CART_PAGE_SIZE], first + 1):
+        text, button = _cart_line(tr, item, i)
+        lines.append(text)
+        kb.append([button])
+    lines.append("")
+    lines.append(tr.cart_total(total=get_cart_total(uid)))
+
+    if pages > 1:
+        kb.append(_cart_nav(tr, page, pages))
+    kb.extend(_cart_kb(tr).inline_keyboard)
+    result = "\n".join(lines), InlineKeyboardMarkup(kb)
+    cart_pages[uid][(tr, page)] = result
+    return result
+
+
+# --- Cached keyboards (one per locale / state) ---
+@lru_cache(maxsize=None)
+def _main_menu_kb(tr):
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton(tr.btn_coffee, callback_data="category_coffee")],
+            [InlineKeyboardButton(tr.btn_food, callback_data="category_food")],
+            [InlineKeyboardButton(tr.btn_drinks, callback_data="category_drinks")],
+            [InlineKeyboardButton(tr.btn_view_cart, callback_data="view_cart")],
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def _help_kb(tr):
+    kb = []
+    if ADMIN_USERNAME:
+        kb.append(
+            [
+                InlineKeyboardButton(
+                    tr.btn_contact_admin, url=f"https://t.me/{ADMIN_USERNAME}"
+                )
+            ]
+        )
+    kb.append([InlineKeyboardButton(tr.btn_home, callback_data="back_to_menu")])
+    return InlineKeyboardMarkup(kb)
+
+
+@lru_cache(maxsize=None)
+def _back_kb(tr, callback_data: str = "back_to_menu"):
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(tr.btn_back, callback_data=callback_data)]]
+    )
+
+
+@lru_cache(maxsize=None)
+def _home_kb(tr):
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(tr.btn_home, callback_data="back_to_menu")]]
+    )
+
+
+@lru_cache(maxsize=None)
+def _category_kb(tr, category: str):
+    kb = []
+    for name, info in MENU.get(category, {}).items():
+        kb.append(
+            [
+                InlineKeyboardButton(
+                    tr.menu_item(emoji=info["emoji"], name=name, price=info["price"]),
+                    callback_data=f"select_{category}_{name}",
+                )
+            ]
+        )
+    kb.append([InlineKeyboardButton(tr.btn_back, callback_data="back_to_menu")])
+    return InlineKeyboardMarkup(kb)
+
+
+@lru_cache(maxsize=None)
+def _order_kb(tr, category: str, editing: bool = False):
+    kb = []
+
+    # Always show size + quantity
+    row1 = [InlineKeyboardButton(tr.btn_size, callback_data="customize_size")]
+
+    # Add sugar/ice buttons only if not food
+    if category != "food":
+        row1.append(InlineKeyboardButton(tr.btn_sugar, callback_data="customize_sugar"))
+        row2 = [
+            InlineKeyboardButton(tr.btn_ice, callback_data="customize_ice"),
+            InlineKeyboardButton(tr.btn_quantity, callback_data="customize_quantity"),
+        ]
+        kb.append(row1)
+        kb.append(row2)
+    else:
+        # For food: just show size and quantity
+        row1.append(
+            InlineKeyboardButton(tr.btn_quantity, callback_data="customize_quantity")
+        )
+        kb.append(row1)
+
+    # Confirm & back buttons (editing a cart line saves it and returns to the cart)
+    if editing:
+        kb.append(
+            [
+                InlineKeyboardButton(tr.btn_save, callback_data="confirm_add"),
+                InlineKeyboardButton(tr.btn_back, callback_data="view_cart"),
+            ]
+        )
+    else:
+        kb.append(
+            [
+                InlineKeyboardButton(tr.btn_add_to_cart, callback_data="confirm_add"),
+                InlineKeyboardButton(tr.btn_back, callback_data=f"category_{category}"),
+            ]
+        )
+    return InlineKeyboardMarkup(kb)
+
+
+# bounded: `current` should always be a known option key, but the cache must
+# not grow on whatever ends up in a temp order
+@lru_cache(maxsize=64)
+def _choice_kb(tr, kind: str, current: str):
+    """Option picker for size/sugar/ice with the current choice on top."""
+    options = {"size": SIZE_OPTIONS, "sugar": SUGAR_OPTIONS, "ice": ICE_OPTIONS}[kind]
+    labels = {"size": tr.sizes, "sugar": tr.sugars, "ice": tr.ices}[kind]
+
+    kb = [
+        [
+            InlineKeyboardButton(
+                tr.current_choice(label=labels.get(current, current)),
+                callback_data="none",
+            )
+        ]
+    ]
+    for key, val in options.items():
+        if key == current:
+            continue
+        label = labels[key]
+        if val.get("price", 0):
+            label = tr.extra_price(label=label, price=val["price"])
+        kb.append([InlineKeyboardButton(label, callback_data=f"set_{kind}_{key}")])
+    kb.append([InlineKeyboardButton(tr.btn_back, callback_data="back_to_order")])
+    return InlineKeyboardMarkup(kb)
+
+
+@lru_cache(maxsize=None)
+def _added_kb(tr, category: str):
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton(tr.btn_view_cart, callback_data="view_cart")],
+            [InlineKeyboardButton(tr.btn_continue, callback_data=f"category_{category}")],
+            [InlineKeyboardButton(tr.btn_home, callback_data="back_to_menu")],
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def _cart_kb(tr):
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton(tr.btn_checkout, callback_data="checkout")],
+            [InlineKeyboardButton(tr.btn_clear_cart, callback_data="clear_cart")],
+            [InlineKeyboardButton(tr.btn_back, callback_data="back_to_menu")],
+        ]
+    )
+
+
+# bounded: pages grows with the cart size
+@lru_cache(maxsize=256)
+def _cart_nav(tr, page: int, pages: int):
+    """Previous / "page/pages" / next row of a paginated cart."""
+    nav = []
+    if page > 0:
+        nav.append(InlineKeyboardButton("◀️", callback_data=f"cart_page_{page - 1}"))
+    nav.append(
+        InlineKeyboardButton(tr.cart_page(page=page + 1, pages=pages), callback_data="none")
+    )
+    if page < pages - 1:
+        nav.append(InlineKeyboardButton("▶️", callback_data=f"cart_page_{page + 1}"))
+    return tuple(nav)
+
+
+@lru_cache(maxsize=None)
+def _checkout_kb(tr):
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton(tr.btn_pickup, callback_data="delivery_pickup")],
+            [InlineKeyboardButton(tr.btn_delivery, callback_data="delivery_delivery")],
+            [InlineKeyboardButton(tr.btn_back, callback_data="view_cart")],
+        ]
+    )
+
+
 # --- Commands / Entry points ---
+@traced
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # safe message retrieval when called from callback or command
     msg = getattr(update, "message", None) or (
@@ -62,64 +474,86 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if msg is None:
         return
 
-    keyboard = [
-        [InlineKeyboardButton("☕ កាហ្វេ", callback_data="category_coffee")],
-        [InlineKeyboardButton("🍽️ អាហារ", callback_data="category_food")],
-        [InlineKeyboardButton("🥤 ភេសជ្ជៈ", callback_data="category_drinks")],
-        [InlineKeyboardButton("🛒 មើលកន្ត្រក", callback_data="view_cart")],
-    ]
-    await msg.reply_text(
-        "☕ សូមស្វាគមន៍មកកាហ្វេរបស់យើង!\n\nជ្រើសរើសប្រភេទខាងក្រោម៖",
-        reply_markup=InlineKeyboardMarkup(keyboard),
-    )
+    if update.effective_user is not None:
+        _leave_edit_mode(update.effective_user.id)
+    tr = _tr(update)
+    await msg.reply_text(tr.welcome, reply_markup=_main_menu_kb(tr))
 
 
+@traced
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     msg = update.message
     if msg is None:
         return
-    kb = []
-    if ADMIN_USERNAME:
-        kb.append(
-            [
-                InlineKeyboardButton(
-                    "📩 Contact Admin", url=f"https://t.me/{ADMIN_USERNAME}"
-                )
-            ]
+    tr = _tr(update)
+    await msg.reply_text(tr.help, reply_markup=_help_kb(tr))
+
+
+# --- Admin: on-demand profiling ---
+async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/profile [seconds] - run cProfile for a while and send back the stats."""
+    msg = update.message
+    if msg is None:
+        return
+    user = update.effective_user
+    if (
+        not ADMIN_USERNAME
+        or user is None
+        or user.username != ADMIN_USERNAME.lstrip("@")
+    ):
+        return
+
+    seconds = 30
+    if context.args and context.args[0].isdigit():
+        seconds = max(1, min(int(context.args[0]), 600))
+
+    token = start_profiler("/profile")
+    if token is None:
+        await msg.reply_text(f"⏱️ Profiler is already running ({profiler_owner()}).")
+        return
+    await msg.reply_text(f"⏱️ Profiling for {seconds}s...\n\n{format_route_stats()}")
+
+    async def finish():
+        await asyncio.sleep(seconds)
+        report = stop_profiler(token)
+        if report is None:
+            await context.bot.send_message(
+                chat_id=msg.chat_id,
+                text="⏱️ Profiling session was stopped before it finished.",
+            )
+            return
+        await context.bot.send_document(
+            chat_id=msg.chat_id,
+            document=io.BytesIO(report.encode("utf-8")),
+            filename=f"profile-{datetime.now().strftime('%Y%m%d%H%M%S')}.txt",
+            caption=format_route_stats()[:1024],
         )
-    kb.append([InlineKeyboardButton("🏠 Back", callback_data="back_to_menu")])
-    await msg.reply_text("💬 Need help?", reply_markup=InlineKeyboardMarkup(kb))
+
+    # don't block the update queue while the profiler is collecting
+    context.application.create_task(finish(), update=update)
 
 
 # --- Category listing ---
+@traced
 async def show_category(update, context, category: str):
     query = update.callback_query
     if query is None:
         return
     await query.answer()
 
-    items = MENU.get(category, {})
-    if not items:
-        await query.edit_message_text("❌ មិនមានទំនិញនេះទេ")
+    tr = _tr(update)
+    if not MENU.get(category):
+        await query.edit_message_text(tr.item_not_found)
         return
 
-    kb = []
-    for name, info in items.items():
-        kb.append(
-            [
-                InlineKeyboardButton(
-                    f"{info['emoji']} {name} - ${info['price']:.2f}",
-                    callback_data=f"select_{category}_{name}",
-                )
-            ]
-        )
-    kb.append([InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_menu")])
     await query.edit_message_text(
-        f"📋 ម៉ឺនុយ {category}៖", reply_markup=InlineKeyboardMarkup(kb)
+        tr.category_title(category=tr.categories.get(category, category)),
+        reply_markup=_category_kb(tr, category),
     )
 
 
 # --- Start customizing an item ---
+@traced
 async def show_customization(update, context, category: str, item_name: str):
     query = update.callback_query
     if query is None:
@@ -128,11 +562,13 @@ async def show_customization(update, context, category: str, item_name: str):
 
     items = MENU.get(category, {})
     if item_name not in items:
-        await query.edit_message_text("❌ មិនមានទំនិញនេះទេ")
+        await query.edit_message_text(_tr(update).item_not_found)
         return
 
     item = items[item_name]
     uid = query.from_user.id
+    # picking from the menu always starts a fresh line, never edits one
+    _leave_edit_mode(uid)
     t = get_temp(uid)
     # set up temp order defaults
     t.update(
@@ -151,6 +587,7 @@ async def show_customization(update, context, category: str, item_name: str):
 
 
 # --- Centralized order view (single source of truth) ---
+@traced
 async def refresh_order_view(update, context):
     query = update.callback_query
     if query is None:
@@ -160,58 +597,16 @@ async def refresh_order_view(update, context):
     uid = query.from_user.id
     t = get_temp(uid)
     _ensure_defaults(t)
+    tr = _tr(update)
 
-    # Calculate total price
-    size_add = SIZE_OPTIONS.get(t["size"], {}).get("price", 0.0)
-    total = (t["base_price"] + size_add) * t["quantity"]
-
-    # Build order summary text
-    text = f"{t['emoji']} {t['item_name']}\n"
-    text += f"📏 ទំហំ: {SIZE_OPTIONS.get(t['size'], {}).get('label', t['size'])}\n"
-
-    # Only include sugar and ice for non-food items
-    if t["category"] != "food":
-        text += (
-            f"🍬 ស្ករ: {SUGAR_OPTIONS.get(t['sugar'], {}).get('label', t['sugar'])}\n"
-        )
-        text += f"🧊 ទឹកកក: {ICE_OPTIONS.get(t['ice'], {}).get('label', t['ice'])}\n"
-
-    text += f"🔢 ចំនួន: {t['quantity']}\n\n💰 តម្លៃសរុប: ${total:.2f}"
-
-    # --- Keyboard Layout ---
-    kb = []
-
-    # Always show size + quantity
-    row1 = [InlineKeyboardButton("📏 ទំហំ", callback_data="customize_size")]
-
-    # Add sugar/ice buttons only if not food
-    if t["category"] != "food":
-        row1.append(InlineKeyboardButton("🍬 ស្ករ", callback_data="customize_sugar"))
-        row2 = [
-            InlineKeyboardButton("🧊 ទឹកកក", callback_data="customize_ice"),
-            InlineKeyboardButton("🔢 ចំនួន", callback_data="customize_quantity"),
-        ]
-        kb.append(row1)
-        kb.append(row2)
-    else:
-        # For food: just show size and quantity
-        row1.append(InlineKeyboardButton("🔢 ចំនួន", callback_data="customize_quantity"))
-        kb.append(row1)
-
-    # Confirm & back buttons
-    kb.append(
-        [
-            InlineKeyboardButton("✅ បញ្ចូលកន្ត្រក", callback_data="confirm_add"),
-            InlineKeyboardButton(
-                "⬅️ ត្រលប់ក្រោយ", callback_data=f"category_{t['category']}"
-            ),
-        ]
+    text = _order_view_text(tr, t)
+    await query.edit_message_text(
+        text, reply_markup=_order_kb(tr, t["category"], "editing" in t)
     )
 
-    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(kb))
-
 
 # --- Quantity UI (live) ---
+@traced
 async def show_quantity_editor(update, context):
     query = update.callback_query
     if query is None:
@@ -221,6 +616,7 @@ async def show_quantity_editor(update, context):
     t = get_temp(uid)
     _ensure_defaults(t)
     qty = t["quantity"]
+    tr = _tr(update)
 
     kb = [
         [
@@ -228,13 +624,14 @@ async def show_quantity_editor(update, context):
             InlineKeyboardButton(f"{qty}", callback_data="qty_none"),
             InlineKeyboardButton("➕", callback_data="qty_inc"),
         ],
-        [InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_order")],
+        [InlineKeyboardButton(tr.btn_back, callback_data="back_to_order")],
     ]
     await query.edit_message_text(
-        f"🔢 កែចំនួន៖ {qty}", reply_markup=InlineKeyboardMarkup(kb)
+        tr.quantity_editor(quantity=qty), reply_markup=InlineKeyboardMarkup(kb)
     )
 
 
+@traced
 async def quantity_change(update, context, op: str):
     query = update.callback_query
     if query is None:
@@ -255,6 +652,7 @@ async def quantity_change(update, context, op: str):
 
 
 # --- Size / Sugar / Ice editors (show choices) ---
+@traced
 async def show_size_editor(update, context):
     query = update.callback_query
     if query is None:
@@ -262,30 +660,13 @@ async def show_size_editor(update, context):
     await query.answer()
     uid = query.from_user.id
     t = get_temp(uid)
-    current = t.get("size", "medium")
-
-    kb = []
-    # Show currently selected size at the top
-    current_label = SIZE_OPTIONS.get(current, {}).get("label", current)
-    kb.append(
-        [InlineKeyboardButton(f"✅ កំពុងជ្រើសរើស: {current_label}", callback_data="none")]
+    tr = _tr(update)
+    await query.edit_message_text(
+        tr.choose_size, reply_markup=_choice_kb(tr, "size", t.get("size", "medium"))
     )
 
-    for key, val in SIZE_OPTIONS.items():
-        if key == current:
-            continue
-        price_text = f" +${val['price']:.2f}" if val.get("price", 0) else ""
-        kb.append(
-            [
-                InlineKeyboardButton(
-                    f"{val['label']}{price_text}", callback_data=f"set_size_{key}"
-                )
-            ]
-        )
-    kb.append([InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_order")])
-    await query.edit_message_text("📏 ជ្រើសទំហំ:", reply_markup=InlineKeyboardMarkup(kb))
-
 
+@traced
 async def show_sugar_editor(update, context):
     query = update.callback_query
     if query is None:
@@ -293,27 +674,13 @@ async def show_sugar_editor(update, context):
     await query.answer()
     uid = query.from_user.id
     t = get_temp(uid)
-    current = t.get("sugar", "50")
-
-    kb = []
-    kb.append(
-        [
-            InlineKeyboardButton(
-                f"✅ កំពុងជ្រើសរើស: {SUGAR_OPTIONS.get(current, {}).get('label', current)}",
-                callback_data="none",
-            )
-        ]
+    tr = _tr(update)
+    await query.edit_message_text(
+        tr.choose_sugar, reply_markup=_choice_kb(tr, "sugar", t.get("sugar", "50"))
     )
-    for key, val in SUGAR_OPTIONS.items():
-        if key == current:
-            continue
-        kb.append(
-            [InlineKeyboardButton(val["label"], callback_data=f"set_sugar_{key}")]
-        )
-    kb.append([InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_order")])
-    await query.edit_message_text("🍬 ជ្រើសស្ករ:", reply_markup=InlineKeyboardMarkup(kb))
 
 
+@traced
 async def show_ice_editor(update, context):
     query = update.callback_query
     if query is None:
@@ -321,130 +688,182 @@ async def show_ice_editor(update, context):
     await query.answer()
     uid = query.from_user.id
     t = get_temp(uid)
-    current = t.get("ice", "normal")
-
-    kb = []
-    kb.append(
-        [
-            InlineKeyboardButton(
-                f"✅ កំពុងជ្រើសរើស: {ICE_OPTIONS.get(current, {}).get('label', current)}",
-                callback_data="none",
-            )
-        ]
+    tr = _tr(update)
+    await query.edit_message_text(
+        tr.choose_ice, reply_markup=_choice_kb(tr, "ice", t.get("ice", "normal"))
     )
-    for key, val in ICE_OPTIONS.items():
-        if key == current:
-            continue
-        kb.append([InlineKeyboardButton(val["label"], callback_data=f"set_ice_{key}")])
-    kb.append([InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_order")])
-    await query.edit_message_text("🧊 ជ្រើសទឹកកក:", reply_markup=InlineKeyboardMarkup(kb))
 
 
 # --- Confirm add & Cart flow ---
+@traced
 async def confirm_add(update, context):
     query = update.callback_query
     if query is None:
         return
-    await query.answer("✅ Added!")
+    tr = _tr(update)
     uid = query.from_user.id
-    cart = get_cart(uid)
     t = get_temp(uid)
     _ensure_defaults(t)
 
-    size_price = SIZE_OPTIONS.get(t["size"], {}).get("price", 0.0)
-    total = (t["base_price"] + size_price) * t["quantity"]
-    cart.append({**t, "total_price": total})
+    if "editing" in t:
+        # save the edited options back into the same cart line
+        line_id = t["editing"]
+        pos, _ = _find_line(get_cart(uid), line_id)
+        temp_orders[uid] = {}
+        if pos is None:
+            await query.answer(tr.item_not_found)
+            await view_cart(update, context)
+            return
+        await query.answer(tr.saved_toast)
+        _cart_replace(uid, pos, _cart_item(t, line_id))
+        await show_cart_item(update, context, line_id)
+        return
 
-    # Build a success message showing what was added
-    success_text = (
-        f"✅ បានបញ្ចូលទៅកន្ត្រក!\n\n"
-        f"{t['emoji']} {t['item_name']}\n"
-        f"📏 ទំហំ: {SIZE_OPTIONS.get(t['size'], {}).get('label', t['size'])}\n"
-    )
-    
-    # Only show sugar/ice for non-food items
-    if t["category"] != "food":
-        success_text += (
-            f"🍬 ស្ករ: {SUGAR_OPTIONS.get(t['sugar'], {}).get('label', t['sugar'])}\n"
-            f"🧊 ទឹកកក: {ICE_OPTIONS.get(t['ice'], {}).get('label', t['ice'])}\n"
-        )
-    
-    success_text += (
-        f"🔢 ចំនួន: {t['quantity']}\n"
-        f"💰 តម្លៃ: ${total:.2f}"
-    )
+    await query.answer(tr.added_toast)
+    item = _cart_item(t, next(_line_ids))
+    _cart_add(uid, item)
+    total = item["total_price"]
 
-    # Create keyboard with View Cart and Continue Shopping buttons
-    kb = [
-        [InlineKeyboardButton("🛒 មើលកន្ត្រក", callback_data="view_cart")],
-        [InlineKeyboardButton("➕ បន្តកម្មង់", callback_data=f"category_{t['category']}")],
-        [InlineKeyboardButton("🏠 ត្រលប់ទៅម៉ឺនុយ", callback_data="back_to_menu")],
-    ]
+    # Build a success message showing what was added
+    success_text = _added_text(tr, t, total)
 
     # clear temp order for that user
     temp_orders[uid] = {}
-    
+
     # Show success message with cart option
     await query.edit_message_text(
-        success_text,
-        reply_markup=InlineKeyboardMarkup(kb)
+        success_text, reply_markup=_added_kb(tr, t["category"])
     )
-async def view_cart(update, context):
+
+
+@traced
+async def view_cart(update, context, page: int = 0):
     query = update.callback_query
     if query is None:
         return
     await query.answer()
     uid = query.from_user.id
+    _leave_edit_mode(uid)
     cart = get_cart(uid)
+    tr = _tr(update)
     if not cart:
-        await query.edit_message_text(
-            "🛒 កន្ត្រកទទេ!",
-            reply_markup=InlineKeyboardMarkup(
-                [[InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_menu")]]
-            ),
-        )
+        await query.edit_message_text(tr.cart_empty, reply_markup=_back_kb(tr))
         return
 
-    text = "🛒 កន្ត្រករបស់អ្នក:\n\n"
-    total_all = 0.0
-    for i, it in enumerate(cart, 1):
-        text += f"{i}. {it.get('emoji','')} {it.get('item_name','')} x{it.get('quantity',1)} = ${it.get('total_price',0):.2f}\n"
-        total_all += it.get("total_price", 0.0)
-    text += f"\n💰 សរុប: ${total_all:.2f}"
+    text, kb = _cart_page(tr, uid, page)
+    await query.edit_message_text(text, reply_markup=kb)
 
+
+@traced
+async def show_cart_item(update, context, line_id: int):
+    """Single cart line with quantity, edit and remove actions."""
+    query = update.callback_query
+    if query is None:
+        return
+    await query.answer()
+    uid = query.from_user.id
+    _leave_edit_mode(uid)
+    pos, item = _find_line(get_cart(uid), line_id)
+    if item is None:
+        await view_cart(update, context)
+        return
+    tr = _tr(update)
+
+    text = "\n".join(
+        [
+            f"{pos + 1}. "
+            + tr.item_title(emoji=item["emoji"], item_name=item["item_name"]),
+            *_item_lines(tr, item),
+            "",
+            tr.item_total_line(total=item["total_price"]),
+        ]
+    )
     kb = [
-        [InlineKeyboardButton("✅ បញ្ជាទិញ", callback_data="checkout")],
-        [InlineKeyboardButton("🗑️ លុបកន្ត្រក", callback_data="clear_cart")],
-        [InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="back_to_menu")],
+        [
+            InlineKeyboardButton("➖", callback_data=f"cart_dec_{line_id}"),
+            InlineKeyboardButton(f"{item['quantity']}", callback_data="none"),
+            InlineKeyboardButton("➕", callback_data=f"cart_inc_{line_id}"),
+        ],
+        [InlineKeyboardButton(tr.btn_edit_options, callback_data=f"cart_edit_{line_id}")],
+        [InlineKeyboardButton(tr.btn_remove, callback_data=f"cart_del_{line_id}")],
+        [
+            InlineKeyboardButton(
+                tr.btn_back, callback_data=f"cart_page_{pos // CART_PAGE_SIZE}"
+            )
+        ],
     ]
     await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(kb))
 
 
+@traced
+async def cart_item_quantity(update, context, line_id: int, op: str):
+    query = update.callback_query
+    if query is None:
+        return
+    await query.answer()
+    uid = query.from_user.id
+    pos, item = _find_line(get_cart(uid), line_id)
+    if item is not None:
+        qty = item["quantity"] + 1 if op == "inc" else max(1, item["quantity"] - 1)
+        if qty == item["quantity"]:
+            # already at 1: re-sending the same view fails with "not modified"
+            return
+        _cart_replace(uid, pos, _cart_item({**item, "quantity": qty}, line_id))
+    await show_cart_item(update, context, line_id)
+
+
+@traced
+async def remove_cart_item(update, context, line_id: int):
+    query = update.callback_query
+    if query is None:
+        return
+    await query.answer(_tr(update).removed_toast)
+    uid = query.from_user.id
+    pos, _ = _find_line(get_cart(uid), line_id)
+    page = 0
+    if pos is not None:
+        _cart_remove(uid, pos)
+        page = pos // CART_PAGE_SIZE
+    await view_cart(update, context, page)
+
+
+@traced
+async def edit_cart_item(update, context, line_id: int):
+    """Reopen a cart line in the order view; confirm_add saves it in place."""
+    query = update.callback_query
+    if query is None:
+        return
+    uid = query.from_user.id
+    _, item = _find_line(get_cart(uid), line_id)
+    if item is None:
+        await view_cart(update, context)
+        return
+    temp_orders[uid] = {**{k: item[k] for k in ITEM_KEYS}, "editing": line_id}
+    await refresh_order_view(update, context)
+
+
+@traced
 async def clear_cart(update, context):
     query = update.callback_query
     if query is None:
         return
-    await query.answer("🗑️ Cleared!")
-    user_carts[query.from_user.id] = []
+    await query.answer(_tr(update).cleared_toast)
+    _cart_clear(query.from_user.id)
     await view_cart(update, context)
 
 
 # --- Checkout / process order ---
+@traced
 async def checkout(update, context):
     query = update.callback_query
     if query is None:
         return
     await query.answer()
-    kb = [
-        [InlineKeyboardButton("🏪 មកយកផ្ទាល់", callback_data="delivery_pickup")],
-        [InlineKeyboardButton("🚚 ដឹកជញ្ជូន", callback_data="delivery_delivery")],
-        [InlineKeyboardButton("⬅️ ត្រលប់ក្រោយ", callback_data="view_cart")],
-    ]
-    await query.edit_message_text(
-        "📦 ជ្រើសរើសវិធី:", reply_markup=InlineKeyboardMarkup(kb)
-    )
+    tr = _tr(update)
+    await query.edit_message_text(tr.choose_method, reply_markup=_checkout_kb(tr))
 
 
+@traced
 async def process_order(update, context, method: str):
     query = update.callback_query
     if query is None:
@@ -452,68 +871,29 @@ async def process_order(update, context, method: str):
     await query.answer()
     uid = query.from_user.id
     cart = get_cart(uid)
+    tr = _tr(update)
     if not cart:
-        await query.edit_message_text("🛒 កន្ត្រកទទេ!")
+        await query.edit_message_text(tr.cart_empty)
         return
 
-    total_all = sum(it.get("total_price", 0) for it in cart)
+    total_all = get_cart_total(uid)
     order_id = f"ORD{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    delivery_text = "មកយកផ្ទាល់" if method == "pickup" else "ដឹកជញ្ជូន"
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    customer = query.from_user.full_name
 
     # Build detailed order text
-    order_detail_text = f"🧾 ព័ត៌មានការកម្មង់ #{order_id}\n"
-    order_detail_text += f"📦 វិធី: {delivery_text}\n"
-    order_detail_text += f"👤 អ្នកកម្មង់: {query.from_user.full_name}\n"
-    order_detail_text += (
-        f"🕒 ពេលវេលា: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    order_detail_text = _order_receipt_text(
+        tr, cart, order_id, method, customer, now, total_all
     )
 
-    for i, item in enumerate(cart, 1):
-        order_detail_text += (
-            f"{i}. {item.get('emoji','')} {item.get('item_name','')}\n"
-            f"   📏 ទំហំ: {SIZE_OPTIONS.get(item['size'], {}).get('label', item['size'])}\n"
-            f"   🍬 ស្ករ: {SUGAR_OPTIONS.get(item['sugar'], {}).get('label', item['sugar'])}\n"
-            f"   🧊 ទឹកកក: {ICE_OPTIONS.get(item['ice'], {}).get('label', item['ice'])}\n"
-            f"   🔢 ចំនួន: {item['quantity']}\n"
-            f"   💰 តម្លៃសរុប: ${item['total_price']:.2f}\n\n"
-        )
-
-    order_detail_text += f"💰 សរុប: ${total_all:.2f}\n"
-    order_detail_text += "🙏 សូមអរគុណសម្រាប់ការកម្មង់របស់អ្នក!"
-
     # Send order confirmation to user (instead of just a simple message)
-    await query.edit_message_text(
-        order_detail_text,
-        reply_markup=InlineKeyboardMarkup(
-            [[InlineKeyboardButton("🏠 ត្រលប់ទៅម៉ឺនុយ", callback_data="back_to_menu")]]
-        ),
-    )
+    await query.edit_message_text(order_detail_text, reply_markup=_home_kb(tr))
 
-    # Build detailed notification for admin and group
-    notify_text = (
-        f"🔔 កម្មង់ថ្មី #{order_id}\n"
-        f"👤 អ្នកកម្មង់: {query.from_user.full_name}\n"
-        f"📦 វិធី: {delivery_text}\n"
-        f"🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    # Build detailed notification for admin and group (shop's locale)
+    notify_text = _order_notify_text(
+        get_catalog(DEFAULT_LOCALE), cart, order_id, method, customer, now, total_all
     )
 
-    for i, item in enumerate(cart, 1):
-        notify_text += (
-            f"{i}. {item.get('emoji','')} {item.get('item_name','')}\n"
-            f"   📏 ទំហំ: {SIZE_OPTIONS.get(item['size'], {}).get('label', item['size'])}\n"
-        )
-        # Show sugar & ice only for non-food items
-        if item.get("category") != "food":
-            notify_text += (
-                f"   🍬 ស្ករ: {SUGAR_OPTIONS.get(item['sugar'], {}).get('label', item['sugar'])}\n"
-                f"   🧊 ទឹកកក: {ICE_OPTIONS.get(item['ice'], {}).get('label', item['ice'])}\n"
-            )
-        notify_text += (
-            f"   🔢 ចំនួន: {item['quantity']}\n" f"   💰 ${item['total_price']:.2f}\n\n"
-        )
-
-    notify_text += f"💰សរុប: ${total_all:.2f}\n"
-
     # Send to group chat
     if GROUP_CHAT_ID:
         try:
@@ -522,10 +902,11 @@ async def process_order(update, context, method: str):
             logging.error(f"Failed to notify group {GROUP_CHAT_ID}: {e}")
 
     # Clear the user cart after confirmation
-    user_carts[uid] = []
+    _cart_clear(uid)
 
 
 # --- Main callback dispatcher ---
+@traced
 async def button_callback(update, context):
     query = update.callback_query
     if query is None:
@@ -554,8 +935,11 @@ async def button_callback(update, context):
         return
     if data.startswith("set_size_"):
         # set and refresh full order view
-        t = get_temp(uid)
-        t["size"] = data.split("_", 2)[2]
+        value = data.split("_", 2)[2]
+        if value not in SIZE_OPTIONS:
+            await query.answer(_tr(update).unknown_action)
+            return
+        get_temp(uid)["size"] = value
         await refresh_order_view(update, context)
         return
 
@@ -564,8 +948,11 @@ async def button_callback(update, context):
         await show_sugar_editor(update, context)
         return
     if data.startswith("set_sugar_"):
-        t = get_temp(uid)
-        t["sugar"] = data.split("_", 2)[2]
+        value = data.split("_", 2)[2]
+        if value not in SUGAR_OPTIONS:
+            await query.answer(_tr(update).unknown_action)
+            return
+        get_temp(uid)["sugar"] = value
         await refresh_order_view(update, context)
         return
 
@@ -574,8 +961,11 @@ async def button_callback(update, context):
         await show_ice_editor(update, context)
         return
     if data.startswith("set_ice_"):
-        t = get_temp(uid)
-        t["ice"] = data.split("_", 2)[2]
+        value = data.split("_", 2)[2]
+        if value not in ICE_OPTIONS:
+            await query.answer(_tr(update).unknown_action)
+            return
+        get_temp(uid)["ice"] = value
         await refresh_order_view(update, context)
         return
 
@@ -605,6 +995,24 @@ async def button_callback(update, context):
     if data == "clear_cart":
         await clear_cart(update, context)
         return
+    if data.startswith("cart_"):
+        # cart_{action}_{number}: page index or cart line id
+        _, action, num = (data.split("_", 2) + ["", ""])[:3]
+        if num.isdigit():
+            num = int(num)
+            if action == "page":
+                await view_cart(update, context, num)
+            elif action == "item":
+                await show_cart_item(update, context, num)
+            elif action in ("inc", "dec"):
+                await cart_item_quantity(update, context, num, action)
+            elif action == "del":
+                await remove_cart_item(update, context, num)
+            elif action == "edit":
+                await edit_cart_item(update, context, num)
+            else:
+                await query.answer(_tr(update).unknown_action)
+            return
 
     # checkout and orders
     if data == "checkout":
@@ -614,5 +1022,10 @@ async def button_callback(update, context):
         await process_order(update, context, data.split("_", 1)[1])
         return
 
+    # label-only buttons (current choice, page indicator, quantity)
+    if data in ("none", "qty_none"):
+        await query.answer()
+        return
+
     # fallback
-    await query.answer("❓ មិនស្គាល់សកម្មភាព")
+    await query.answer(_tr(update).unknown_action)
@@ -0,0 +1,88 @@
+import re
+import string
+
+from locales import km, en
+from menu_order.option_item import SIZE_OPTIONS, SUGAR_OPTIONS, ICE_OPTIONS
+
+
+DEFAULT_LOCALE = "km"
+LOCALES = {"km": km, "en": en}
+
+_formatter = string.Formatter()
+# standard format-spec mini-language; no nested fields, quotes or backslashes
+_FORMAT_SPEC = re.compile(
+    r"(?:(?:[^{}\\'\"\s]| )?[<>=^])?[+\- ]?z?#?0?\d*[,_]?(?:\.\d+)?[bcdeEfFgGnosxX%]?"
+)
+
+
+def compile_template(template: str):
+    """Turn a str.format template into an equivalent f-string function.
+
+    Templates without fields are returned as plain strings. Fields must be
+    plain names with a standard format spec (``{total:.2f}`` is fine,
+    ``{item[size]}`` and ``{x:{w}}`` are not), so a locale file can never
+    inject code into the generated function.
+    """
+    fields = []
+    for _, name, spec, conversion in _formatter.parse(template):
+        if name is None:
+            continue
+        if not name.isidentifier():
+            raise ValueError(f"Unsupported field {name!r} in template {template!r}")
+        if conversion not in (None, "r", "s", "a") or not _FORMAT_SPEC.fullmatch(
+            spec
+        ):
+            raise ValueError(
+                f"Unsupported format spec {spec!r} in template {template!r}"
+            )
+        if name not in fields:
+            fields.append(name)
+    if not fields:
+        return template
+    return eval(f"lambda *, {', '.join(fields)}: f{template!r}", {})
+
+
+class Catalog:
+    """Compiled messages of one locale.
+
+    Every text key becomes an attribute: a str for static texts, a
+    keyword-only function for templates, e.g. ``tr.size_line(size=...)``.
+    """
+
+    def __init__(self, code: str, module, fallback=None):
+        self.code = code
+        texts = dict(fallback.TEXTS) if fallback else {}
+        texts.update(module.TEXTS)
+        for key, template in texts.items():
+            setattr(self, key, compile_template(template))
+
+        def labels(options, attr):
+            merged = {k: v["label"] for k, v in options.items()}
+            merged.update(getattr(module, attr, {}))
+            return merged
+
+        self.sizes = labels(SIZE_OPTIONS, "SIZE_LABELS")
+        self.sugars = labels(SUGAR_OPTIONS, "SUGAR_LABELS")
+        self.ices = labels(ICE_OPTIONS, "ICE_LABELS")
+        self.categories = {**getattr(fallback, "CATEGORIES", {}), **module.CATEGORIES}
+
+    def __repr__(self):
+        return f"<Catalog {self.code}>"
+
+
+# Compiled once at import; missing translations fall back to the default locale.
+CATALOGS = {
+    code: Catalog(
+        code, module, None if code == DEFAULT_LOCALE else LOCALES[DEFAULT_LOCALE]
+    )
+    for code, module in LOCALES.items()
+}
+
+
+def get_catalog(language_code=None) -> Catalog:
+    """Pick the catalog for a Telegram ``language_code`` such as "en-US"."""
+    if language_code:
+        catalog = CATALOGS.get(language_code[:2].lower())
+        if catalog is not None:
+            return catalog
+    return CATALOGS[DEFAULT_LOCALE]
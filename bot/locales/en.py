@@ -0,0 +1,97 @@
+TEXTS = {
+    # menu / navigation
+    "welcome": "☕ Welcome to our coffee shop!\n\nPick a category below:",
+    "btn_coffee": "☕ Coffee",
+    "btn_food": "🍽️ Food",
+    "btn_drinks": "🥤 Drinks",
+    "btn_view_cart": "🛒 View cart",
+    "btn_back": "⬅️ Back",
+    "btn_home": "🏠 Back to menu",
+    "help": "💬 Need help?",
+    "btn_contact_admin": "📩 Contact Admin",
+    "unknown_action": "❓ Unknown action",
+    # category listing
+    "item_not_found": "❌ This item is not available",
+    "category_title": "📋 {category} menu:",
+    "menu_item": "{emoji} {name} - ${price:.2f}",
+    # order customization
+    "item_title": "{emoji} {item_name}",
+    "size_line": "📏 Size: {size}",
+    "sugar_line": "🍬 Sugar: {sugar}",
+    "ice_line": "🧊 Ice: {ice}",
+    "quantity_line": "🔢 Quantity: {quantity}",
+    "item_total_line": "💰 Total: ${total:.2f}",
+    "price_line": "💰 Price: ${total:.2f}",
+    "btn_size": "📏 Size",
+    "btn_sugar": "🍬 Sugar",
+    "btn_ice": "🧊 Ice",
+    "btn_quantity": "🔢 Quantity",
+    "btn_add_to_cart": "✅ Add to cart",
+    "quantity_editor": "🔢 Quantity: {quantity}",
+    "current_choice": "✅ Selected: {label}",
+    "extra_price": "{label} +${price:.2f}",
+    "choose_size": "📏 Choose a size:",
+    "choose_sugar": "🍬 Choose sugar level:",
+    "choose_ice": "🧊 Choose ice level:",
+    # cart
+    "added_toast": "✅ Added!",
+    "added": "✅ Added to cart!",
+    "btn_continue": "➕ Keep ordering",
+    "cart_empty": "🛒 Your cart is empty!",
+    "cart_title": "🛒 Your cart:",
+    "cart_line": "{emoji} {item_name} x{quantity} = ${total:.2f}",
+    "cart_total": "💰 Total: ${total:.2f}",
+    "cart_page": "📄 {page}/{pages}",
+    "btn_edit_line": "✏️ {index}. {item_name} x{quantity}",
+    "btn_edit_options": "✏️ Edit options",
+    "btn_remove": "🗑️ Remove",
+    "btn_save": "✅ Save",
+    "removed_toast": "🗑️ Removed!",
+    "saved_toast": "✅ Saved!",
+    "btn_checkout": "✅ Checkout",
+    "btn_clear_cart": "🗑️ Clear cart",
+    "cleared_toast": "🗑️ Cleared!",
+    # checkout
+    "choose_method": "📦 Choose pickup or delivery:",
+    "btn_pickup": "🏪 Pickup",
+    "btn_delivery": "🚚 Delivery",
+    "method_pickup": "Pickup",
+    "method_delivery": "Delivery",
+    "order_title": "🧾 Order #{order_id}",
+    "new_order_title": "🔔 New order #{order_id}",
+    "method_line": "📦 Method: {method}",
+    "customer_line": "👤 Customer: {name}",
+    "time_line": "🕒 Time: {time}",
+    "notify_time_line": "🕒 {time}",
+    "notify_item_total": "💰 ${total:.2f}",
+    "notify_total": "💰 Total: ${total:.2f}",
+    "order_line": "{index}. {emoji} {item_name}",
+    "thanks": "🙏 Thank you for your order!",
+}
+
+CATEGORIES = {
+    "coffee": "Coffee",
+    "food": "Food",
+    "drinks": "Drinks",
+}
+
+SIZE_LABELS = {
+    "small": "Small (S)",
+    "medium": "Medium (M)",
+    "large": "Large (L)",
+}
+
+SUGAR_LABELS = {
+    "0": "No sugar (0%)",
+    "25": "Less sugar (25%)",
+    "50": "Half sugar (50%)",
+    "75": "More sugar (75%)",
+    "100": "Full sugar (100%)",
+}
+
+ICE_LABELS = {
+    "no": "No ice",
+    "less": "Less ice",
+    "normal": "Normal ice",
+    "extra": "Extra ice",
+}
@@ -0,0 +1,78 @@
+TEXTS = {
+    # menu / navigation
+    "welcome": "☕ សូមស្វាគមន៍មកកាហ្វេរបស់យើង!\n\nជ្រើសរើសប្រភេទខាងក្រោម៖",
+    "btn_coffee": "☕ កាហ្វេ",
+    "btn_food": "🍽️ អាហារ",
+    "btn_drinks": "🥤 ភេសជ្ជៈ",
+    "btn_view_cart": "🛒 មើលកន្ត្រក",
+    "btn_back": "⬅️ ត្រលប់ក្រោយ",
+    "btn_home": "🏠 ត្រលប់ទៅម៉ឺនុយ",
+    "help": "💬 ត្រូវការជំនួយ?",
+    "btn_contact_admin": "📩 ទាក់ទងអ្នកគ្រប់គ្រង",
+    "unknown_action": "❓ មិនស្គាល់សកម្មភាព",
+    # category listing
+    "item_not_found": "❌ មិនមានទំនិញនេះទេ",
+    "category_title": "📋 ម៉ឺនុយ {category}៖",
+    "menu_item": "{emoji} {name} - ${price:.2f}",
+    # order customization
+    "item_title": "{emoji} {item_name}",
+    "size_line": "📏 ទំហំ: {size}",
+    "sugar_line": "🍬 ស្ករ: {sugar}",
+    "ice_line": "🧊 ទឹកកក: {ice}",
+    "quantity_line": "🔢 ចំនួន: {quantity}",
+    "item_total_line": "💰 តម្លៃសរុប: ${total:.2f}",
+    "price_line": "💰 តម្លៃ: ${total:.2f}",
+    "btn_size": "📏 ទំហំ",
+    "btn_sugar": "🍬 ស្ករ",
+    "btn_ice": "🧊 ទឹកកក",
+    "btn_quantity": "🔢 ចំនួន",
+    "btn_add_to_cart": "✅ បញ្ចូលកន្ត្រក",
+    "quantity_editor": "🔢 កែចំនួន៖ {quantity}",
+    "current_choice": "✅ កំពុងជ្រើសរើស: {label}",
+    "extra_price": "{label} +${price:.2f}",
+    "choose_size": "📏 ជ្រើសទំហំ:",
+    "choose_sugar": "🍬 ជ្រើសស្ករ:",
+    "choose_ice": "🧊 ជ្រើសទឹកកក:",
+    # cart
+    "added_toast": "✅ បានបញ្ចូល!",
+    "added": "✅ បានបញ្ចូលទៅកន្ត្រក!",
+    "btn_continue": "➕ បន្តកម្មង់",
+    "cart_empty": "🛒 កន្ត្រកទទេ!",
+    "cart_title": "🛒 កន្ត្រករបស់អ្នក:",
+    "cart_line": "{emoji} {item_name} x{quantity} = ${total:.2f}",
+    "cart_total": "💰 សរុប: ${total:.2f}",
+    "cart_page": "📄 {page}/{pages}",
+    "btn_edit_line": "✏️ {index}. {item_name} x{quantity}",
+    "btn_edit_options": "✏️ កែជម្រើស",
+    "btn_remove": "🗑️ ដកចេញ",
+    "btn_save": "✅ រក្សាទុក",
+    "removed_toast": "🗑️ បានដកចេញ!",
+    "saved_toast": "✅ បានរក្សាទុក!",
+    "btn_checkout": "✅ បញ្ជាទិញ",
+    "btn_clear_cart": "🗑️ លុបកន្ត្រក",
+    "cleared_toast": "🗑️ បានលុប!",
+    # checkout
+    "choose_method": "📦 ជ្រើសរើសវិធី:",
+    "btn_pickup": "🏪 មកយកផ្ទាល់",
+    "btn_delivery": "🚚 ដឹកជញ្ជូន",
+    "method_pickup": "មកយកផ្ទាល់",
+    "method_delivery": "ដឹកជញ្ជូន",
+    "order_title": "🧾 ព័ត៌មានការកម្មង់ #{order_id}",
+    "new_order_title": "🔔 កម្មង់ថ្មី #{order_id}",
+    "method_line": "📦 វិធី: {method}",
+    "customer_line": "👤 អ្នកកម្មង់: {name}",
+    "time_line": "🕒 ពេលវេលា: {time}",
+    "notify_time_line": "🕒 {time}",
+    "notify_item_total": "💰 ${total:.2f}",
+    "notify_total": "💰សរុប: ${total:.2f}",
+    "order_line": "{index}. {emoji} {item_name}",
+    "thanks": "🙏 សូមអរគុណសម្រាប់ការកម្មង់របស់អ្នក!",
+}
+
+CATEGORIES = {
+    "coffee": "កាហ្វេ",
+    "food": "អាហារ",
+    "drinks": "ភេសជ្ជៈ",
+}
+
+# Khmer option labels live in menu_order/option_item.py
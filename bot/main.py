@@ -4,7 +4,8 @@ from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ApplicationBuilder
 
-from handler import start, help_command, button_callback
+from handler import start, help_command, profile_command, button_callback
+from profiling import PROFILE_ENABLED, TracingBot, install_signal_handlers
 
 # Load environment variables
 load_dotenv()
@@ -28,7 +29,12 @@ from telegram.ext import ContextTypes, CommandHandler, ApplicationBuilder
 
 
 def main():
-    application = Application.builder().token(BOT_TOKEN).build()
+    if PROFILE_ENABLED:
+        # trace every Bot API request alongside the handler spans
+        builder = Application.builder().bot(TracingBot(BOT_TOKEN))
+    else:
+        builder = Application.builder().token(BOT_TOKEN)
+    application = builder.post_init(install_signal_handlers).build()
 
 
 
@@ -38,6 +44,7 @@ def main():
 
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("help", help_command))
+    application.add_handler(CommandHandler("profile", profile_command))
     application.add_handler(CallbackQueryHandler(button_callback))
 
     print("🤖 Coffee Bot is running...")
@@ -0,0 +1,265 @@
+import os
+import io
+import asyncio
+import time
+import random
+import signal
+import logging
+import cProfile
+import pstats
+import faulthandler
+from datetime import datetime
+from functools import wraps
+from contextvars import ContextVar
+from dotenv import load_dotenv
+from telegram.ext import ExtBot
+
+
+load_dotenv()
+
+# Tracing is opt-in: with PROFILE_ENABLED unset `traced` returns the handler
+# untouched, so there is no overhead at all.
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0.05"))
+SLOW_HANDLER_MS = float(os.getenv("SLOW_HANDLER_MS", "500"))
+PROFILE_DUMP_DIR = os.getenv("PROFILE_DUMP_DIR", ".")
+
+logger = logging.getLogger(__name__)
+
+# route pattern -> [count, total_ms, max_ms]
+route_stats = {}
+
+# callback_data routes that carry a parameter; stats are kept per prefix so the
+# table stays bounded however many items, pages or cart lines pass through
+_ROUTE_PREFIXES = (
+    "category_",
+    "select_",
+    "set_size_",
+    "set_sugar_",
+    "set_ice_",
+    "delivery_",
+    "cart_page_",
+    "cart_item_",
+    "cart_inc_",
+    "cart_dec_",
+    "cart_edit_",
+    "cart_del_",
+)
+_FIXED_ROUTES = frozenset(
+    (
+        "/start",
+        "/help",
+        "back_to_menu",
+        "customize_size",
+        "customize_sugar",
+        "customize_ice",
+        "customize_quantity",
+        "qty_inc",
+        "qty_dec",
+        "qty_none",
+        "back_to_order",
+        "confirm_add",
+        "view_cart",
+        "clear_cart",
+        "checkout",
+        "none",
+    )
+)
+
+_current_trace = ContextVar("current_trace", default=None)
+_profiler = None
+
+
+class _Trace:
+    __slots__ = ("route", "spans", "api_ms")
+
+    def __init__(self, route: str):
+        self.route = route
+        self.spans = []  # (name, ms)
+        self.api_ms = 0.0
+
+
+def _route_of(update) -> str:
+    query = getattr(update, "callback_query", None)
+    if query is not None:
+        return query.data or ""
+    msg = getattr(update, "message", None)
+    if msg is not None and msg.text:
+        return msg.text.split(maxsplit=1)[0]
+    return "?"
+
+
+def _route_key(route: str) -> str:
+    """Fixed pattern for a raw route, e.g. "cart_item_42" -> "cart_item_*"."""
+    route = route.split("@", 1)[0]  # /start@BotName
+    if route in _FIXED_ROUTES:
+        return route
+    for prefix in _ROUTE_PREFIXES:
+        if route.startswith(prefix):
+            return prefix + "*"
+    # arbitrary client-sent callback data must not add keys either
+    return "other"
+
+
+def _finish(trace: _Trace, name: str, total_ms: float):
+    key = _route_key(trace.route)
+    stats = route_stats.get(key)
+    if stats is None:
+        route_stats[key] = [1, total_ms, total_ms]
+    else:
+        stats[0] += 1
+        stats[1] += total_ms
+        if total_ms > stats[2]:
+            stats[2] = total_ms
+
+    slow = total_ms >= SLOW_HANDLER_MS
+    # Only slow requests and a random sample are formatted and logged.
+    if not slow and random.random() >= PROFILE_SAMPLE_RATE:
+        return
+    spans = ", ".join(f"{n}={ms:.1f}ms" for n, ms in trace.spans)
+    logger.log(
+        logging.WARNING if slow else logging.INFO,
+        "%s handler %s route=%r total=%.1fms api=%.1fms local=%.1fms [%s]",
+        "Slow" if slow else "Sampled",
+        name,
+        trace.route,
+        total_ms,
+        trace.api_ms,
+        total_ms - trace.api_ms,
+        spans,
+    )
+
+
+def traced(func):
+    """Time an async handler; the outermost call owns the trace for the update."""
+    if not PROFILE_ENABLED:
+        return func
+    name = func.__name__
+
+    @wraps(func)
+    async def wrapper(update, context, *args, **kwargs):
+        trace = _current_trace.get()
+        start = time.perf_counter()
+        if trace is not None:
+            # nested handler call (e.g. button_callback -> view_cart)
+            try:
+                return await func(update, context, *args, **kwargs)
+            finally:
+                trace.spans.append((name, (time.perf_counter() - start) * 1000))
+
+        trace = _Trace(_route_of(update))
+        token = _current_trace.set(trace)
+        try:
+            return await func(update, context, *args, **kwargs)
+        finally:
+            _current_trace.reset(token)
+            _finish(trace, name, (time.perf_counter() - start) * 1000)
+
+    return wrapper
+
+
+class TracingBot(ExtBot):
+    """ExtBot that records every Bot API request as a span of the current trace."""
+
+    __slots__ = ()
+
+    async def _post(self, endpoint, *args, **kwargs):
+        trace = _current_trace.get()
+        if trace is None:
+            return await super()._post(endpoint, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return await super()._post(endpoint, *args, **kwargs)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            trace.spans.append((f"api:{endpoint}", ms))
+            trace.api_ms += ms
+
+
+# --- On-demand profiling ---
+# One cProfile session at a time, shared by /profile and SIGUSR2. Each session
+# gets a token so only its owner can stop it.
+_profiler_owner = None
+_profiler_token = None
+_signal_token = None
+
+
+def profiler_owner():
+    """Who started the running session ("/profile", "SIGUSR2"), or None."""
+    return _profiler_owner
+
+
+def start_profiler(owner: str):
+    """Start cProfile; return a token for stop_profiler, or None if one is running."""
+    global _profiler, _profiler_owner, _profiler_token
+    if _profiler is not None:
+        return None
+    _profiler = cProfile.Profile()
+    _profiler_owner = owner
+    _profiler_token = object()
+    _profiler.enable()
+    return _profiler_token
+
+
+def stop_profiler(token, limit: int = 40):
+    """Stop the session started with `token` and return its top entries.
+
+    Returns None if that session is no longer the one running.
+    """
+    global _profiler, _profiler_owner, _profiler_token
+    if _profiler is None or token is not _profiler_token:
+        return None
+    profiler = _profiler
+    profiler.disable()
+    _profiler = _profiler_owner = _profiler_token = None
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+def format_route_stats(limit: int = 15) -> str:
+    if not route_stats:
+        return "No handler timings recorded."
+    rows = sorted(route_stats.items(), key=lambda kv: kv[1][2], reverse=True)
+    lines = ["route  count  avg_ms  max_ms"]
+    for route, (count, total, worst) in rows[:limit]:
+        lines.append(f"{route}  {count}  {total / count:.1f}  {worst:.1f}")
+    return "\n".join(lines)
+
+
+def _toggle_profiler():
+    """SIGUSR2: start a session, or stop the one SIGUSR2 started and dump it."""
+    global _signal_token
+    if _profiler is None:
+        _signal_token = start_profiler("SIGUSR2")
+        logger.info("cProfile started (SIGUSR2)")
+        return
+    if _profiler_owner != "SIGUSR2":
+        logger.warning("SIGUSR2 ignored: cProfile is in use by %s", _profiler_owner)
+        return
+    # stop first so a failed dump never leaves the profiler running
+    report = stop_profiler(_signal_token)
+    _signal_token = None
+    path = os.path.join(
+        PROFILE_DUMP_DIR, f"profile-{datetime.now().strftime('%Y%m%d%H%M%S')}.txt"
+    )
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+    except OSError as e:
+        logger.error("cProfile stopped, but writing %s failed: %s", path, e)
+        return
+    logger.info("cProfile stopped, stats written to %s", path)
+
+
+async def install_signal_handlers(application=None):
+    """SIGUSR1 dumps every thread's stack to stderr, SIGUSR2 toggles cProfile.
+
+    Meant as the Application's post_init hook: SIGUSR2 goes through the running
+    event loop, so the toggle runs as a normal callback, not a raw signal handler.
+    """
+    if not hasattr(signal, "SIGUSR1"):
+        # not available on Windows
+        return
+    faulthandler.register(signal.SIGUSR1, all_threads=True)
+    asyncio.get_running_loop().add_signal_handler(signal.SIGUSR2, _toggle_profiler)